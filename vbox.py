@@ -1,20 +1,39 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
 import json
+import shutil
+import asyncio
 import argparse
 import platform
 
 from pathlib import Path
+from functools import lru_cache
 from random import randint
-from subprocess import run, CalledProcessError
+from subprocess import run, PIPE, CalledProcessError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 VBOX_MANAGE = os.getenv("VBOX_MANAGE", "VBoxManage")
+VBOX_MANAGE = shutil.which(VBOX_MANAGE) or VBOX_MANAGE  # resolve PATH once, not per call
+VBOX_BACKEND = os.getenv("VBOXPY_BACKEND", "vboxmanage")
 APP_DIR = os.getenv("VBOXPY_APP_DIR", os.path.join(str(Path.home()), '.vboxpy'))
 DEFAULTS_PATH = os.path.join(APP_DIR, 'defaults.json')
 DEFAULT_BASE = os.path.join(str(Path.home()), 'VirtualBox VMs')
+READ_ONLY_COMMANDS = ('list', 'showvminfo')
+
+_VM_LINE_RE = re.compile(rb'^"(.*)"\s+\{([0-9a-f-]+)\}', re.M)
+_VM_INFO_LINE_RE = re.compile(rb'^([^:\n]*):(.*)$', re.M)
+_BLANK_LINE_RE = re.compile(rb'\r?\n[ \t]*\r?\n')
+_OSTYPE_RE = re.compile(rb'^ID:[ \t]*(\S+)', re.M)
+_DEFAULT_ROUTE_RE = re.compile(rb'^default .*?\bdev (\S+)', re.M)
 
 
 # === Text Colors ===
@@ -38,7 +57,22 @@ WARN = BOLD + RED + "[!] " + RESET
 PROMPT = BOLD + PURPLE + "[?] " + RESET
 
 def vbox_manage(args):
-    ''' Wrapper around teh VBoxManage command '''
+    '''
+    Wrapper around teh VBoxManage command, read-only queries are cached for
+    the life of the process and any other command clears the caches.
+    '''
+    if args[0] in READ_ONLY_COMMANDS:
+        return _vbox_manage_cached(tuple(args))
+    try:
+        return _vbox_manage(args)
+    finally:
+        clear_caches()
+
+@lru_cache(maxsize=None)
+def _vbox_manage_cached(args):
+    return _vbox_manage(list(args))
+
+def _vbox_manage(args):
     proc = run([VBOX_MANAGE] + args, capture_output=True)
     try:
         proc.check_returncode()
@@ -47,22 +81,48 @@ def vbox_manage(args):
         print(proc.stderr.decode('utf-8'))
         raise err        
 
+def clear_caches():
+    ''' Drops cached VBoxManage output, call after changing VMs outside of vbox_manage() '''
+    _vbox_manage_cached.cache_clear()
+    list_running_ids.cache_clear()
+    vm_index.cache_clear()
+
+async def vbox_manage_async(args):
+    ''' Like vbox_manage() but for use in an event loop, returns stdout '''
+    proc = await asyncio.create_subprocess_exec(VBOX_MANAGE, *args, stdout=PIPE, stderr=PIPE)
+    stdout, stderr = await proc.communicate()
+    if proc.returncode:
+        print(stderr.decode('utf-8'))
+        raise CalledProcessError(proc.returncode, [VBOX_MANAGE] + args, stdout, stderr)
+    return stdout
+
+@lru_cache(maxsize=1)
+def vbox_sdk():
+    '''
+    Connects to VBoxSVC with the VirtualBox SDK bindings when VBOXPY_BACKEND=sdk,
+    returns (manager, vbox) or None if the SDK is not selected, not installed or
+    cannot connect, in which case callers fall back to VBoxManage.
+    '''
+    if VBOX_BACKEND != 'sdk':
+        return None
+    try:
+        import vboxapi
+        manager = vboxapi.VirtualBoxManager(None, None)
+        return manager, manager.getVirtualBox()
+    except Exception:
+        return None
+
 def ip_route_show():
     proc = run(['ip', 'route', 'show'], capture_output=True)
     proc.check_returncode()
     return proc
 
 def parse_vm_list_line(line):
-    ''' Parses vm list output from VBoxManage '''
-    # name
-    lquote = line.find(b'"') + 1
-    rquote = line[lquote:].find(b'"') + 1
-    name = line[lquote:rquote]
-    # id
-    lbrace = line.find(b'{') + 1
-    rbrace = line[lquote:].find(b'}') + 1
-    id = line[lbrace:rbrace]
-    return id.decode('utf-8'), name.decode('utf-8')
+    ''' Parses vm list output from VBoxManage, returns (None, None) for other lines '''
+    match = _VM_LINE_RE.match(line)
+    if match is None:
+        return None, None
+    return match.group(2).decode('ascii'), match.group(1).decode('utf-8')
 
 def parse_vm_info_line(line):
     '''
@@ -70,19 +130,29 @@ def parse_vm_info_line(line):
     is inconsistent in how it display some information, so
     for example USB output may not be parsed correctly.
     '''
-    if b':' not in line:
+    key, sep, value = line.partition(b':')
+    if not sep:
         return None, None
-    key, value = line.split(b':', 1)
     return key.decode('utf-8'), value.strip()
 
+def parse_vm_info(output):
+    ''' Parses vminfo output into a dict keyed by lowercase key, first occurrence wins '''
+    info = {}
+    for match in _VM_INFO_LINE_RE.finditer(output):
+        info.setdefault(match.group(1).decode('utf-8').lower(), match.group(2).strip())
+    return info
+
 
 class VirtualMachine(object):
 
     ''' Virtual Machine class for easy access to VM attributes '''
 
-    def __init__(self, id, name):
+    __slots__ = ('id', 'name', '_info_cache')
+
+    def __init__(self, id, name, info=None):
         self.id = id
         self.name = name
+        self._info_cache = info
 
     def __str__(self):
         return "<id: %s, name: %s>" % (self.id, self.name)
@@ -90,18 +160,19 @@ class VirtualMachine(object):
     def __eq__(self, other):
         return self.id == other.id
 
+    def __hash__(self):
+        return hash(self.id)
+
     def eject(self):
         ''' Eject disk from DVDDrive, this function currently makes assumptions about names '''
         storage_name = "%s_sata" % self.name
         vbox_manage(["storageattach", self.name, "--storagectl", storage_name, '--port', '0', '--type', 'dvddrive', '--medium', 'none'])
     
-    def is_running(self):
-        ps = vbox_manage(["list", "runningvms"])
-        for line in ps.stdout.split(b'\n'):
-            id, _ = parse_vm_list_line(line)
-            if id == self.id:
-                return True
-        return False
+    def is_running(self, running_ids=None):
+        ''' Running VM ids are listed once and cached, running_ids overrides them '''
+        if running_ids is None:
+            running_ids = list_running_ids()
+        return self.id in running_ids
     
     def start(self):
         vbox_manage(['startvm', self.name, '--type', 'headless'])
@@ -116,15 +187,11 @@ class VirtualMachine(object):
         return self._info(key)
 
     def _info(self, key):
-        ''' Parses showvminfo command for a given key and returns the raw value '''
-        info = vbox_manage(["showvminfo", self.id])
-        for line in info.stdout.split(b'\n'):
-            info_key, info_value = parse_vm_info_line(line)
-            if info_key is None:
-                continue
-            if info_key.lower() == key.lower():
-                return info_value
-        return None
+        ''' Returns the showvminfo value for a key as str, the output is parsed once per VM '''
+        if self._info_cache is None:
+            self._info_cache = parse_vm_info(vbox_manage(["showvminfo", self.id]).stdout)
+        value = self._info_cache.get(key.lower())
+        return None if value is None else value.decode('utf-8')
 
 
 ### Command Helpers ###
@@ -132,80 +199,153 @@ def confirm_prompt(prompt):
     response = input(PROMPT+prompt+' [Y/n]: ')
     return str(response).lower() in ['y', 'yes']
 
+@lru_cache(maxsize=1)
 def list_ostypes():
     ls = vbox_manage(["list", "ostypes"])
-    ostypes = []
-    for line in ls.stdout.split(b'\n'):
-        if line.startswith(b"ID:"):
-            ostypes.append(line[3:].strip().decode('utf-8'))
-    return ostypes
-
-def list_vms():
-    ls = vbox_manage(["list", "vms"])
+    return [match.group(1).decode('utf-8') for match in _OSTYPE_RE.finditer(ls.stdout)]
+
+def parse_vm_list(output):
+    return [VirtualMachine(match.group(2).decode('ascii'), match.group(1).decode('utf-8'))
+            for match in _VM_LINE_RE.finditer(output)]
+
+def parse_vm_list_long(output):
     vms = []
-    for line in ls.stdout.split(b'\n'):
-        if not line:
+    info = None
+    for block in _BLANK_LINE_RE.split(output):
+        block_info = parse_vm_info(block)
+        if not block_info:
             continue
-        id, name = parse_vm_list_line(line)
-        vms.append(VirtualMachine(id, name))
+        # A VM's output starts with Name/UUID, any other block is a section of the previous VM
+        if next(iter(block_info)) == 'name' and 'uuid' in block_info:
+            info = block_info
+            # The long format prints '<inaccessible!>', use the '<inaccessible>' that list vms prints
+            name = '<inaccessible>' if info['name'] == b'<inaccessible!>' else info['name'].decode('utf-8')
+            vms.append(VirtualMachine(info['uuid'].decode('utf-8'), name, info))
+        elif info is not None:
+            for key, value in block_info.items():
+                info.setdefault(key, value)
     return vms
 
+def parse_running_ids(output):
+    return {match.group(2).decode('ascii') for match in _VM_LINE_RE.finditer(output)}
+
+def list_vms(long=False):
+    ''' With long=True all VM info is fetched in one call and cached on each VM '''
+    if long:
+        return parse_vm_list_long(vbox_manage(["list", "--long", "vms"]).stdout)
+    sdk = vbox_sdk()
+    if sdk is not None:
+        manager, vbox = sdk
+        # Inaccessible machines only expose their id, VBoxManage lists them under this name
+        return [VirtualMachine(m.id, m.name if m.accessible else '<inaccessible>')
+                for m in manager.getArray(vbox, 'machines')]
+    return parse_vm_list(vbox_manage(["list", "vms"]).stdout)
+
+@lru_cache(maxsize=1)
+def list_running_ids():
+    sdk = vbox_sdk()
+    if sdk is not None:
+        manager, vbox = sdk
+        # The states VBoxManage list runningvms reports
+        c = manager.constants
+        running = {c.MachineState_Running, c.MachineState_Paused, c.MachineState_Teleporting,
+                   c.MachineState_LiveSnapshotting, c.MachineState_TeleportingPausedVM}
+        return {m.id for m in manager.getArray(vbox, 'machines')
+                if m.accessible and m.state in running}
+    return parse_running_ids(vbox_manage(["list", "runningvms"]).stdout)
+
+def list_vms_and_running_ids(long=False):
+    ''' Runs the VM list and running VM queries concurrently, see list_vms() for long '''
+    if vbox_sdk() is not None:
+        return list_vms(long), list_running_ids()
+    list_args = ["list", "--long", "vms"] if long else ["list", "vms"]
+    async def query():
+        return await asyncio.gather(vbox_manage_async(list_args), vbox_manage_async(["list", "runningvms"]))
+    vms_output, running_output = asyncio.run(query())
+    vms = parse_vm_list_long(vms_output) if long else parse_vm_list(vms_output)
+    return vms, parse_running_ids(running_output)
+
+def poll_vm_info(vms, keys, max_workers=10):
+    '''
+    Looks up info keys for many VMs, running the showvminfo calls concurrently.
+    Returns {vm.id: {key: value}}, with None for VMs that could not be queried.
+    '''
+    def poll_single_vm(vm):
+        try:
+            return {key: vm[key] for key in keys}
+        except CalledProcessError:
+            return None
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(vms)))) as executor:
+        futures = {executor.submit(poll_single_vm, vm): vm for vm in vms}
+        for future in as_completed(futures):
+            results[futures[future].id] = future.result()
+    return results
+
+@lru_cache(maxsize=1)
+def vm_index():
+    ''' Maps VM names and ids to VMs, the first VM wins if names are duplicated '''
+    vms = list_vms()
+    return {vm.name: vm for vm in reversed(vms)}, {vm.id: vm for vm in vms}
+
 def vm_by_name(name):
-    for vm in list_vms():
-        if vm.name == name:
-            return vm
-    return None
+    return vm_index()[0].get(name)
 
 def vm_by_id(id):
-    for vm in list_vms():
-        if vm.id == id:
-            return vm
-    return None
+    return vm_index()[1].get(id)
 
+def resolve_vm(args):
+    ''' Finds the VM given by --name or --id, prints a warning and returns None if there is none '''
+    if args.name:
+        vm = vm_by_name(args.name)
+        if vm is None:
+            print(WARN+"No virtual machine with name '%s'" % args.name)
+    elif args.id:
+        vm = vm_by_id(args.id)
+        if vm is None:
+            print(WARN+"No virtual machine with id '%s'" % args.id)
+    else:
+        vm = None
+        print(WARN+"Specify a virtual machine with --name or --id")
+    return vm
+
+@lru_cache(maxsize=1)
 def get_default_network_adapter():
     if platform.system() not in ['Linux']:
         return None
-    ip = ip_route_show()
-    for line in ip.stdout.split(b'\n'):
-        if not line.startswith(b'default'):
-            continue
-        words = line.split(b' ')
-        return words[words.index(b'dev')+1].decode('utf-8')
+    match = _DEFAULT_ROUTE_RE.search(ip_route_show().stdout)
+    return match.group(1).decode('utf-8') if match else None
 
 def get_default(key, default_value=None):
-    if not os.path.exists(DEFAULTS_PATH):
-        return default_value
-    try:
-        with open(DEFAULTS_PATH, 'r') as fp:
-            defaults = json.loads(fp.read())
-            return defaults.get(key, default_value)
-    except:
-        return default_value
+    return get_defaults().get(key, default_value)
 
+@lru_cache(maxsize=1)
 def get_defaults():
+    ''' Loads defaults.json once per process, set_defaults() keeps the cache current '''
     if not os.path.exists(DEFAULTS_PATH):
         return {}
     try:
-        with open(DEFAULTS_PATH, 'r') as fp:
-            return json.loads(fp.read())
+        with open(DEFAULTS_PATH, 'rb') as fp:
+            return orjson.loads(fp.read()) if orjson else json.load(fp)
     except:
         return {}
 
 def set_defaults(args):
-    defaults = {}
-    if os.path.exists(DEFAULTS_PATH):
-        try:
-            with open(DEFAULTS_PATH, 'r') as fp:
-                defaults = json.loads(fp.read())
-        except:
-            pass
-    if 'func' in args:
-        del args['func']
+    defaults = get_defaults().copy()
+    args.pop('func', None)
     defaults.update(args)
-    if not os.path.exists(APP_DIR):
-        os.mkdir(APP_DIR)
-    with open(DEFAULTS_PATH, 'w') as fp:
-        fp.write(json.dumps(defaults))
+    os.makedirs(APP_DIR, exist_ok=True)
+    # Write to a temp file and rename it over defaults.json so a crash never leaves it truncated
+    tmp_path = DEFAULTS_PATH + '.tmp'
+    if orjson:
+        with open(tmp_path, 'wb') as fp:
+            fp.write(orjson.dumps(defaults))
+    else:
+        with open(tmp_path, 'w') as fp:
+            json.dump(defaults, fp)
+    os.replace(tmp_path, DEFAULTS_PATH)
+    get_defaults().update(defaults)
 
 def create_vm(args):
     '''
@@ -226,52 +366,61 @@ def create_vm(args):
 ### CLI Command Handlers ###
 def ls(args):
     ''' List virtual machines '''
-    vms = list_vms()
-    max_name = max([len(vm.name) for vm in vms])
-    row_format = "{:<%d}" % max_name
+    # The long listing caches every VM's info, with --running only the shown VMs are queried in parallel
+    vms, running_ids = list_vms_and_running_ids(long=args.vrde and not args.running)
+    if args.running:
+        vms = [vm for vm in vms if vm.id in running_ids]
+    if args.vrde and args.running:
+        vrde = {id: (info or {}).get('VRDE') for id, info in poll_vm_info(vms, ['VRDE']).items()}
+    elif args.vrde:
+        vrde = {vm.id: vm['VRDE'] for vm in vms}
+    max_name = max((len(vm.name) for vm in vms), default=0)
+    row_format = ("{:<%d}" % max_name).format
+    rows = []
     for vm in vms:
-        color = GREEN if vm.is_running() else RESET
-        line = row_format.format(vm.name)
+        color = GREEN if vm.id in running_ids else RESET
+        line = row_format(vm.name)
         if args.ids:
-            line += " " + row_format.format(vm.id)
+            line += " " + row_format(vm.id)
         if args.vrde:
-            line += " VRDE: " + vm['VRDE'].decode('utf-8')
-        if args.running and not vm.is_running():
-            continue
-        print(color+line+RESET)
+            line += " VRDE: " + (vrde[vm.id] or '')
+        rows.append(color+line+RESET)
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
 
 def create(args):
     ''' Create a new virtual machine '''
+    if args.os_type not in list_ostypes():
+        print(WARN+"Unknown OS type '%s'" % args.os_type)
+        return
+    if args.bridge_adapter is None:
+        args.bridge_adapter = get_default_network_adapter()
     if vm_by_name(args.name) is not None:
         print(WARN+"VM '%s' already exists" % args.name)
         return
     vm = create_vm(args)
     print(INFO+"Created VM '%s'" % vm.name)
-    print(INFO+"VRDE: " + vm['VRDE'].decode('utf-8'))
+    print(INFO+"VRDE: " + vm['VRDE'])
 
 def defaults(args):
     ''' Configure default settings '''
+    if args.os_type not in list_ostypes():
+        print(WARN+"Unknown OS type '%s'" % args.os_type)
+        return
+    if args.bridge_adapter is None:
+        args.bridge_adapter = get_default_network_adapter()
     set_defaults(vars(args))
     defaults = get_defaults()
-    max_key = max([len(key) for key in defaults])
-    row_format = "{:<%d}" % max_key
-    for key, value in defaults.items():
-        line = "%s%s%s " % (BOLD, row_format.format(key), RESET)
-        line += str(value)
-        print(line)
+    max_key = max(map(len, defaults), default=0)
+    row_format = ("{:<%d}" % max_key).format
+    rows = ["%s%s%s %s" % (BOLD, row_format(key), RESET, value) for key, value in defaults.items()]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
 
 def rm(args):
     ''' Delete a VM '''
-    vm = None
-    if args.name:
-        vm = vm_by_name(args.name)
-    elif args.id:
-        vm = vm_by_id(args.id)
+    vm = resolve_vm(args)
     if vm is None:
-        if args.name:
-            print(WARN+"No virtual machine with name '%s'" % args.name)
-        elif args.id:
-            print(WARN+"No virtual machine with id '%s'" % args.id)
         return
     confirm = confirm_prompt('Delete %s (id: %s)' % (vm.name, vm.id))
     if not confirm:
@@ -281,32 +430,16 @@ def rm(args):
 
 def start(args):
     ''' Start a VM '''
-    vm = None
-    if args.name:
-        vm = vm_by_name(args.name)
-    elif args.id:
-        vm = vm_by_id(args.id)
+    vm = resolve_vm(args)
     if vm is None:
-        if args.name:
-            print(WARN+"No virtual machine with name '%s'" % args.name)
-        elif args.id:
-            print(WARN+"No virtual machine with id '%s'" % args.id)
         return
     vm.start()
     print(INFO+"Started vm '%s'" % vm.name)
 
 def stop(args):
     ''' Stop a VM '''
-    vm = None
-    if args.name:
-        vm = vm_by_name(args.name)
-    elif args.id:
-        vm = vm_by_id(args.id)
+    vm = resolve_vm(args)
     if vm is None:
-        if args.name:
-            print(WARN+"No virtual machine with name '%s'" % args.name)
-        elif args.id:
-            print(WARN+"No virtual machine with id '%s'" % args.id)
         return
     vm.stop()
     print(INFO+"Stopped vm '%s'" % vm.name)
@@ -315,43 +448,46 @@ def stop(args):
 def main(args):
     pass
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(prog=__file__)
-    parser.set_defaults(func=main)
-    
-    subparsers = parser.add_subparsers(help='Sub-commands')
-
-    # defaults
-    parser_defaults = subparsers.add_parser('defaults', help='Configure default VM settings')
-    parser_defaults.add_argument('--base-folder', 
+def add_vm_arguments(parser, for_defaults=False):
+    ''' Adds the VM settings shared by the create and defaults commands '''
+    parser.add_argument('--base-folder',
         default=get_default('base_folder', DEFAULT_BASE),
         type=str,
-        help='Set default base folder to store VMs')
-    parser_defaults.add_argument('--os-type',
-        default=get_default('os-type', 'Other_64'),
-        choices=list_ostypes(),
+        help='Set default base folder to store VMs' if for_defaults else 'Base folder to store VMs')
+    parser.add_argument('--os-type',
+        default=get_default('os_type', 'Other_64'),
         type=str,
-        help='Default guest OS type')
-    parser_defaults.add_argument('--cpus',
+        help='Default guest OS type' if for_defaults else 'Specify guest OS type')
+    parser.add_argument('--cpus',
         default=get_default('cpus', 4),
         type=int,
-        help='Default number of CPU cores')
-    parser_defaults.add_argument('--ram',
+        help='Default number of CPU cores' if for_defaults else 'Number of CPU cores')
+    parser.add_argument('--ram',
         default=get_default('ram', 4096),
         type=int,
-        help='Default RAM (MBs)')
-    parser_defaults.add_argument('--vram',
+        help='Default RAM (MBs)' if for_defaults else 'RAM (MBs)')
+    parser.add_argument('--vram',
         default=get_default('vram', 128),
         type=int,
-        help='Default video memory (MBs)')
-    parser_defaults.add_argument('--storage',
+        help='Default video memory (MBs)' if for_defaults else 'Video memory (MBs)')
+    parser.add_argument('--storage',
         default=get_default('storage', 60000),
         type=int,
-        help='Default disk size (MBs)')
-    parser_defaults.add_argument('--bridge-adapter',
-        default=get_default('bridge_adapter', get_default_network_adapter()),
+        help='Default disk size (MBs)' if for_defaults else 'Disk size (MBs)')
+    parser.add_argument('--bridge-adapter',
+        default=get_default('bridge_adapter'),
         type=str,
-        help='Default bridged network adapter')
+        help='Default bridged network adapter' if for_defaults else 'Bridged network adapter')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog=__file__)
+    parser.set_defaults(func=main)
+    
+    subparsers = parser.add_subparsers(help='Sub-commands')
+
+    # defaults
+    parser_defaults = subparsers.add_parser('defaults', help='Configure default VM settings')
+    add_vm_arguments(parser_defaults, for_defaults=True)
     parser_defaults.set_defaults(func=defaults)
 
     # list
@@ -365,31 +501,7 @@ if __name__ == "__main__":
     parser_create = subparsers.add_parser('create', help='Create a VM')
     parser_create.add_argument('--name', required=True, type=str, help='VM name')
     parser_create.add_argument('--iso', required=True, type=str, help='Path to operating system ISO')
-    parser_create.add_argument('--os-type',
-        default=get_default('os-type', 'Other_64'),
-        choices=list_ostypes(),
-        type=str,
-        help='Specify guest OS type')
-    parser_create.add_argument('--base-folder',
-        default=get_default('base_folder', DEFAULT_BASE),
-        type=str,
-        help='Base folder to store VMs')
-    parser_create.add_argument('--cpus',
-        default=get_default('cpus', 4),
-        type=int,
-        help='Number of CPU cores')
-    parser_create.add_argument('--ram',
-        default=get_default('ram', 4096),
-        type=int,
-        help='RAM (MBs)')
-    parser_create.add_argument('--vram',
-        default=get_default('vram', 128),
-        type=int,
-        help='Video memory (MBs)')
-    parser_create.add_argument('--storage',
-        default=get_default('storage', 60000),
-        type=int,
-        help='Disk size (MBs)')
+    add_vm_arguments(parser_create)
     parser_create.add_argument('--vrde-port',
         default=randint(5000, 6000),
         type=int,
@@ -398,10 +510,6 @@ if __name__ == "__main__":
         default='127.0.0.1',
         type=str,
         help='VRDE host interface')
-    parser_create.add_argument('--bridge-adapter',
-        default=get_default('bridge_adapter', get_default_network_adapter()),
-        type=str,
-        help='Bridged network adapter')
     parser_create.set_defaults(func=create)
 
     # rm